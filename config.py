@@ -16,10 +16,15 @@ class AppConfig:
     CHAPTERS_DIR = "chapters"
     VECTOR_STORE_DIR = "vector_store"
     FAISS_INDEX_NAME = "novel.faiss"
+    STORY_STATE_FILENAME = "story_state.json"
     
     # --- RAG (Faiss) 설정 ---
     # 한국어 임베딩에 특화된 모델 사용
     EMBEDDING_MODEL = 'jhgan/ko-sroberta-multitask'
     RAG_TOP_K = 3 # 다음 챕터 생성 시 참조할 관련 챕터 수
 
+    # --- 인물/세계 상태 메모리 설정 ---
+    STATE_MAX_FACTS_PER_CATEGORY = 5 # 프롬프트에 포함할 다중값 항목(부상, 소지품, 사건)의 분류별 최신 사실 수
+    RECENT_CHAPTER_TAIL_CHARS = 1500 # 상태 메모리 사용 시 프롬프트에 포함할 최근 챕터 끝부분 길이
+
 config = AppConfig()
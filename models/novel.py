@@ -2,6 +2,7 @@
 from dataclasses import dataclass, field
 from typing import List, Optional
 from models.character import Character
+from models.story_state import StoryState
 
 @dataclass
 class NovelSettings:
@@ -53,6 +54,7 @@ class Novel:
     settings: NovelSettings = field(default_factory=NovelSettings)
     chapters: List[Chapter] = field(default_factory=list)
     summary: str = "" # LLM이 생성한 전체 내용 요약
+    story_state: StoryState = field(default_factory=StoryState) # 챕터마다 갱신되는 인물/세계 상태
 
     @property
     def full_text(self) -> str:
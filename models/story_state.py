@@ -0,0 +1,198 @@
+# models/story_state.py
+import json
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional
+
+# 상태 항목 분류 (키: 저장용 식별자, 값: 프롬프트 표시용 이름)
+STATE_CATEGORIES = {
+    "location": "위치",
+    "relationship": "관계",
+    "injury": "부상",
+    "possession": "소지품",
+    "plot_thread": "미해결 사건",
+}
+
+# 새 값이 들어오면 이전 값을 대체하는 단일값 항목
+SINGLE_VALUE_CATEGORIES = {"location"}
+
+# 상대(target)별로 하나의 값만 유지하는 항목
+TARGETED_CATEGORIES = {"relationship"}
+
+# 텍스트에서 엔티티를 찾을 때 사용할 최소 이름 길이 ("검"이 "검은"에 매칭되는 식의 오탐 방지)
+MIN_ENTITY_NAME_LENGTH = 2
+
+def _is_true(value) -> bool:
+    """LLM 응답의 불리언 값을 해석합니다. 문자열 "true"/"false"도 처리합니다."""
+    if isinstance(value, str):
+        return value.strip().lower() == "true"
+    return value is True
+
+def parse_state_updates(response: str) -> Optional[List[dict]]:
+    """
+    상태 추출 응답을 갱신 목록으로 파싱합니다. ```json 코드 블록으로 감싼 응답도 처리합니다.
+    JSON 배열이 아니면 None을 반환합니다.
+    """
+    text = response.strip()
+    if text.startswith("```"):
+        text = text.strip("`")
+        text = text[text.find("["):] if "[" in text else text
+    try:
+        updates = json.loads(text)
+    except json.JSONDecodeError:
+        return None
+    return updates if isinstance(updates, list) else None
+
+@dataclass
+class StateFact:
+    """특정 엔티티(인물, 장소, 사물 등)에 대한 하나의 사실 데이터 클래스"""
+    entity: str
+    category: str
+    value: str
+    chapter_index: int
+    target: str = "" # 관계의 상대 엔티티
+    fact_id: str = "" # 해소 시 참조하는 짧은 식별자 (예: "f3")
+
+    def to_dict(self):
+        return {
+            "id": self.fact_id,
+            "entity": self.entity,
+            "category": self.category,
+            "target": self.target,
+            "value": self.value,
+            "chapter_index": self.chapter_index,
+        }
+
+    @staticmethod
+    def from_dict(data: dict):
+        return StateFact(
+            entity=data.get("entity", ""),
+            category=data.get("category", ""),
+            value=data.get("value", ""),
+            chapter_index=data.get("chapter_index", 0),
+            target=data.get("target", ""),
+            fact_id=data.get("id", ""),
+        )
+
+@dataclass
+class StoryState:
+    """
+    챕터마다 점진적으로 갱신되는 구조화된 인물/세계 상태 데이터 클래스.
+    사실(StateFact)들은 엔티티 이름으로 색인되어, 프롬프트에는 언급된 엔티티의 사실만 포함됩니다.
+    """
+    facts: Dict[str, List[StateFact]] = field(default_factory=dict)
+    next_id: int = 1
+
+    @property
+    def entities(self) -> List[str]:
+        """상태가 기록된 엔티티 이름 리스트를 반환"""
+        return list(self.facts.keys())
+
+    def add_fact(self, fact: StateFact) -> bool:
+        """
+        사실을 추가합니다. 단일값 항목은 같은 엔티티의 이전 값을, 관계는 같은 상대와의 이전 관계를 대체합니다.
+        유효하지 않은 사실이면 False를 반환합니다.
+        """
+        if not fact.entity or fact.category not in STATE_CATEGORIES or not fact.value:
+            return False
+        if fact.category in TARGETED_CATEGORIES and not fact.target:
+            return False
+
+        if fact.fact_id:
+            # 저장된 사실을 불러올 때는 기존 id를 유지하고, 이후 발급할 id가 겹치지 않게 합니다.
+            suffix = fact.fact_id[1:]
+            if suffix.isdigit():
+                self.next_id = max(self.next_id, int(suffix) + 1)
+        else:
+            fact.fact_id = f"f{self.next_id}"
+            self.next_id += 1
+
+        entity_facts = self.facts.setdefault(fact.entity, [])
+        if fact.category in SINGLE_VALUE_CATEGORIES:
+            entity_facts[:] = [f for f in entity_facts if f.category != fact.category]
+        elif fact.category in TARGETED_CATEGORIES:
+            entity_facts[:] = [
+                f for f in entity_facts
+                if not (f.category == fact.category and f.target == fact.target)
+            ]
+        else:
+            entity_facts[:] = [
+                f for f in entity_facts
+                if not (f.category == fact.category and f.value == fact.value)
+            ]
+        entity_facts.append(fact)
+        return True
+
+    def resolve_fact(self, fact_id: str):
+        """해소된 사실(치유된 부상, 잃어버린 소지품, 종결된 사건 등)을 id로 찾아 제거합니다."""
+        for entity, entity_facts in list(self.facts.items()):
+            entity_facts[:] = [f for f in entity_facts if f.fact_id != fact_id]
+            if not entity_facts:
+                del self.facts[entity]
+
+    def apply_updates(self, updates: List[dict], chapter_index: int):
+        """
+        LLM이 추출한 갱신 목록을 적용합니다.
+        새 사실은 {"entity", "category", "target", "value"}, 해소는 {"id", "resolved": true} 형식입니다.
+        """
+        for update in updates:
+            if not isinstance(update, dict):
+                continue
+            if _is_true(update.get("resolved")):
+                self.resolve_fact(str(update.get("id", "")).strip())
+                continue
+            self.add_fact(StateFact(
+                entity=str(update.get("entity", "")).strip(),
+                category=str(update.get("category", "")).strip(),
+                value=str(update.get("value", "")).strip(),
+                chapter_index=chapter_index,
+                target=str(update.get("target") or "").strip(),
+            ))
+
+    def find_entities(self, texts: Iterable[str]) -> List[str]:
+        """
+        주어진 텍스트들에 이름이 등장하는 엔티티 리스트를 반환합니다.
+        단순 부분 문자열 비교이므로 MIN_ENTITY_NAME_LENGTH보다 짧은 이름은 검색하지 않습니다.
+        """
+        joined = "\n".join(t for t in texts if t)
+        return [
+            entity for entity in self.facts
+            if len(entity) >= MIN_ENTITY_NAME_LENGTH and entity in joined
+        ]
+
+    def facts_for(self, entities: Iterable[str], max_per_category: int = 0) -> Dict[str, List[StateFact]]:
+        """
+        지정한 엔티티들의 사실을 반환합니다.
+        max_per_category가 양수이면 다중값 항목(부상, 소지품, 미해결 사건)만 분류별로 최신 사실을 남기고,
+        위치와 관계는 항상 모두 포함합니다.
+        """
+        result = {}
+        for entity in entities:
+            entity_facts = self.facts.get(entity)
+            if not entity_facts:
+                continue
+            if max_per_category > 0:
+                kept_counts: Dict[str, int] = {}
+                kept = []
+                for fact in reversed(entity_facts):
+                    limited = fact.category not in SINGLE_VALUE_CATEGORIES | TARGETED_CATEGORIES
+                    if limited and kept_counts.get(fact.category, 0) >= max_per_category:
+                        continue
+                    kept_counts[fact.category] = kept_counts.get(fact.category, 0) + 1
+                    kept.append(fact)
+                entity_facts = list(reversed(kept))
+            result[entity] = list(entity_facts)
+        return result
+
+    def to_dict(self):
+        return {
+            "next_id": self.next_id,
+            "facts": [fact.to_dict() for entity_facts in self.facts.values() for fact in entity_facts],
+        }
+
+    @staticmethod
+    def from_dict(data: dict):
+        # add_fact를 거쳐 불러와 런타임과 같은 검증(알 수 없는 분류 제외 등)을 적용합니다.
+        state = StoryState(next_id=data.get("next_id", 1))
+        for fact_data in data.get("facts", []):
+            state.add_fact(StateFact.from_dict(fact_data))
+        return state
@@ -1,7 +1,10 @@
 # prompts/prompt_manager.py
 
 from typing import List
+from config import config
 from novel_data_manager import Novel
+from models.story_state import STATE_CATEGORIES
+from prompts.story_state_formatter import format_fact, format_story_state_section, trim_to_tail
 
 class PromptManager:
     """LLM 프롬프트를 생성하고 관리하는 클래스"""
@@ -34,6 +37,49 @@ class PromptManager:
         ---
         """
 
+    def get_story_state_section(self, novel: Novel, texts: List[str]) -> str:
+        """주어진 텍스트에 등장하는 엔티티의 상태만 골라 프롬프트 섹션을 생성합니다."""
+        return format_story_state_section(novel.story_state, texts, config.STATE_MAX_FACTS_PER_CATEGORY)
+
+    def get_state_update_prompt(self, novel: Novel, chapter_text: str) -> str:
+        """방금 작성된 챕터에서 인물/세계 상태 변화를 JSON으로 추출하기 위한 프롬프트를 생성합니다."""
+        categories_str = "\n".join([f"- {key}: {name}" for key, name in STATE_CATEGORIES.items()])
+
+        known_lines = []
+        for entity, facts in novel.story_state.facts.items():
+            known_lines.append(f"- {entity}")
+            for fact in facts:
+                known_lines.append(f"  - [{fact.fact_id}] {format_fact(fact)}")
+        known_facts_str = "\n".join(known_lines) or "(없음)"
+        character_names_str = ", ".join([char.name for char in novel.settings.characters if char.name]) or "(없음)"
+
+        return f"""
+        다음은 소설의 새 챕터입니다. 이 챕터에서 새로 생기거나 바뀐 인물/세계 상태만 추출해주세요.
+
+        **[상태 분류]**
+        {categories_str}
+
+        **[등장인물 이름]**
+        {character_names_str}
+
+        **[현재 기록된 상태]** ([ ] 안은 사실 id)
+        {known_facts_str}
+
+        **[챕터]**
+        {chapter_text}
+
+        **[지시]**
+        - 결과는 JSON 배열로만 출력하고, 다른 설명은 붙이지 마세요.
+        - 새 사실 형식: {{"entity": "이름", "category": "분류 키", "value": "내용"}}
+        - 관계(relationship)에는 상대 이름을 "target"으로 함께 지정하세요. 같은 상대와의 새 관계는 이전 관계를 대체합니다.
+        - 위치(location)는 새 값이 이전 값을 대체하므로 해소 처리할 필요가 없습니다.
+        - 등장인물은 위 [등장인물 이름]의 이름을 entity와 target에 그대로 사용하세요. (성을 붙이거나 빼지 마세요)
+        - 이미 기록된 엔티티는 같은 이름을 그대로 사용하세요.
+        - 미해결 사건(plot_thread)은 가장 관련 깊은 인물이나 장소를 entity로 지정하세요.
+        - 기록된 부상이 치유되었거나, 소지품을 잃었거나, 사건이 해결되었으면 해당 사실의 id로 {{"id": "f1", "resolved": true}}를 출력하세요.
+        - 변화가 없으면 []를 출력하세요.
+        """
+
     def get_prologue_prompt(self, novel: Novel) -> str:
         """프롤로그 생성을 위한 프롬프트를 생성합니다."""
         base_prompt = self.get_novel_base_prompt(novel)
@@ -59,6 +105,13 @@ class PromptManager:
         user_instruction_section = ""
         if user_instruction:
             user_instruction_section = f"\n\n**[작가 지시]**\n{user_instruction}"
+
+        # 구조화된 상태가 있으면 최근 챕터 전문 대신 끝부분만 넣어 컨텍스트를 줄입니다.
+        # 최근 챕터도 엔티티 검색 대상이므로, 상태가 쌓인 뒤에는 사실상 항상 끝부분만 사용됩니다.
+        recent_chapter = novel.last_chapter or ""
+        story_state_section = self.get_story_state_section(novel, [user_instruction, recent_chapter])
+        if story_state_section:
+            recent_chapter = trim_to_tail(recent_chapter, config.RECENT_CHAPTER_TAIL_CHARS)
             
         return f"""
         {base_prompt}
@@ -67,8 +120,8 @@ class PromptManager:
         {novel.summary}
         
         **[최근 챕터]**
-        {novel.last_chapter}
-        
+        {recent_chapter}
+        {story_state_section}
         {memos_section}
         {user_instruction_section}
         
@@ -0,0 +1,40 @@
+# prompts/story_state_formatter.py
+
+from typing import List
+from models.story_state import STATE_CATEGORIES, StateFact, StoryState
+
+def format_fact(fact: StateFact) -> str:
+    """상태 사실 하나를 프롬프트용 문자열로 변환합니다."""
+    target_str = f"({fact.target}) " if fact.target else ""
+    return f"{STATE_CATEGORIES[fact.category]}: {target_str}{fact.value}"
+
+def trim_to_tail(text: str, max_chars: int) -> str:
+    """
+    텍스트의 끝부분을 max_chars 이내로 자르되, 문단 또는 문장 경계에서 시작하도록 맞춥니다.
+    경계를 따르면 max_chars의 절반도 남지 않는 경우에는 그냥 끝부분을 그대로 사용합니다.
+    """
+    text = text.rstrip()
+    if len(text) <= max_chars:
+        return text
+    tail = text[-max_chars:]
+    for delimiter in ("\n\n", "\n", ". ", "? ", "! "):
+        boundary = tail.find(delimiter)
+        if boundary != -1 and len(tail) - (boundary + len(delimiter)) >= max_chars // 2:
+            return tail[boundary + len(delimiter):]
+    return tail
+
+def format_story_state_section(state: StoryState, texts: List[str], max_per_category: int) -> str:
+    """
+    주어진 텍스트(작가 지시, 최근 챕터 등)에 등장하는 엔티티의 상태만 골라 프롬프트 섹션을 생성합니다.
+    관련된 엔티티가 없으면 빈 문자열을 반환합니다.
+    """
+    entity_facts = state.facts_for(state.find_entities(texts), max_per_category)
+    if not entity_facts:
+        return ""
+
+    lines = []
+    for entity, facts in entity_facts.items():
+        lines.append(f"- {entity}")
+        for fact in facts:
+            lines.append(f"  - {format_fact(fact)} ({fact.chapter_index}장)")
+    return "\n\n**[등장 요소의 현재 상태]**\n" + "\n".join(lines)
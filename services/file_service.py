@@ -5,6 +5,7 @@ import shutil
 from typing import List
 from config import config
 from models.novel import Novel, NovelSettings, Chapter
+from models.story_state import StoryState
 
 class FileService:
     """
@@ -43,6 +44,13 @@ class FileService:
         with open(settings_path, 'w', encoding='utf-8') as f:
             json.dump(novel.settings.to_dict(), f, ensure_ascii=False, indent=4)
 
+    def save_story_state(self, novel: Novel):
+        """소설의 인물/세계 상태(story_state.json)를 저장합니다."""
+        novel_dir = self.get_novel_dir(novel.title)
+        state_path = os.path.join(novel_dir, config.STORY_STATE_FILENAME)
+        with open(state_path, 'w', encoding='utf-8') as f:
+            json.dump(novel.story_state.to_dict(), f, ensure_ascii=False, indent=4)
+
     def save_chapter(self, novel: Novel, chapter_index: int):
         """특정 챕터를 파일로 저장합니다."""
         novel_dir = self.get_novel_dir(novel.title)
@@ -52,6 +60,14 @@ class FileService:
         with open(chapter_path, 'w', encoding='utf-8') as f:
             f.write(chapter.content)
 
+    def save_novel(self, novel: Novel):
+        """소설의 설정, 모든 챕터, 인물/세계 상태를 저장합니다."""
+        self.create_novel_scaffold(novel.title)
+        self.save_settings(novel)
+        for chapter_index in range(len(novel.chapters)):
+            self.save_chapter(novel, chapter_index)
+        self.save_story_state(novel)
+
     def load_novel(self, title: str) -> Novel:
         """디렉토리에서 소설 전체 데이터를 불러옵니다."""
         novel_dir = self.get_novel_dir(title)
@@ -77,6 +93,12 @@ class FileService:
                     content = f.read()
                 novel.chapters.append(Chapter(title=chapter_title, content=content))
         
+        # 인물/세계 상태 파일 로드 (이전 버전에서 만든 소설에는 없을 수 있음)
+        state_path = os.path.join(novel_dir, config.STORY_STATE_FILENAME)
+        if os.path.exists(state_path):
+            with open(state_path, 'r', encoding='utf-8') as f:
+                novel.story_state = StoryState.from_dict(json.load(f))
+
         # TODO: 요약 정보도 별도 파일로 저장하고 불러오는 로직 추가 가능
         
         return novel
@@ -6,6 +6,7 @@ from ..faiss_manager import FaissManager
 from ..prompts.prompt_manager import PromptManager
 from ..config import LLM_MODELS
 from ..novel_data_manager import Novel
+from ..models.story_state import parse_state_updates
 
 class LLMService:
     def __init__(self, llm_clients: Dict[str, LLMClient], prompt_manager: PromptManager, faiss_manager: FaissManager):
@@ -37,16 +38,19 @@ class LLMService:
             prompt=full_prompt
         )
         
+        if "오류 발생" not in content:
+            novel.add_chapter(content)
+            novel.summary = self.active_client.summarize_novel(novel.get_full_text(), self.active_model_id)
+            state_input_tokens, state_output_tokens = self.update_story_state(novel, content)
+            input_tokens += state_input_tokens
+            output_tokens += state_output_tokens
+        
         tokens = {
             "prompt_tokens": input_tokens,
             "completion_tokens": output_tokens,
             "total_tokens": input_tokens + output_tokens
         }
         
-        if "오류 발생" not in content:
-            novel.add_chapter(content)
-            novel.summary = self.active_client.summarize_novel(novel.get_full_text(), self.active_model_id)
-        
         return novel, tokens
 
     def generate_next_chapter(self, novel: Novel) -> tuple[Novel, Dict[str, Any]]:
@@ -63,15 +67,41 @@ class LLMService:
             prompt=full_prompt
         )
         
+        if "오류 발생" not in content:
+            novel.add_chapter(content)
+            novel.summary = self.active_client.summarize_novel(novel.get_full_text(), self.active_model_id)
+            self.faiss_manager.add_chapter_to_index(novel.last_chapter)
+            state_input_tokens, state_output_tokens = self.update_story_state(novel, content)
+            input_tokens += state_input_tokens
+            output_tokens += state_output_tokens
+
         tokens = {
             "prompt_tokens": input_tokens,
             "completion_tokens": output_tokens,
             "total_tokens": input_tokens + output_tokens
         }
-        
-        if "오류 발생" not in content:
-            novel.add_chapter(content)
-            novel.summary = self.active_client.summarize_novel(novel.get_full_text(), self.active_model_id)
-            self.faiss_manager.add_chapter_to_index(novel.last_chapter)
 
         return novel, tokens
+
+    def update_story_state(self, novel: Novel, chapter_text: str) -> tuple[int, int]:
+        """
+        새 챕터에서 인물/세계 상태 변화를 추출해 소설의 상태 메모리에 반영합니다.
+        추출 호출에 사용된 (입력 토큰, 출력 토큰)을 반환합니다.
+        """
+        prompt = self.prompt_manager.get_state_update_prompt(novel, chapter_text)
+        try:
+            response, input_tokens, output_tokens = self.active_client.generate_content(
+                model_id=self.active_model_id,
+                prompt=prompt
+            )
+        except Exception as e:
+            # 챕터는 이미 추가되었으므로, 상태 추출 실패가 챕터 생성 실패로 번지지 않게 합니다.
+            print(f"인물/세계 상태 추출 실패, 기존 상태를 유지합니다: {e}")
+            return 0, 0
+
+        updates = parse_state_updates(response)
+        if updates is None:
+            print(f"인물/세계 상태 응답을 JSON 배열로 해석하지 못해 기존 상태를 유지합니다: {response[:200]}")
+            return input_tokens, output_tokens
+        novel.story_state.apply_updates(updates, chapter_index=len(novel.chapters) - 1)
+        return input_tokens, output_tokens
@@ -0,0 +1,150 @@
+from models.story_state import StateFact, StoryState, parse_state_updates
+
+
+def make_state():
+    state = StoryState()
+    state.apply_updates([
+        {"entity": "민수", "category": "location", "value": "서울"},
+        {"entity": "민수", "category": "injury", "value": "왼팔 골절"},
+        {"entity": "민수", "category": "relationship", "target": "지영", "value": "적대"},
+    ], chapter_index=1)
+    return state
+
+
+def values(state, entity, category):
+    return [f.value for f in state.facts.get(entity, []) if f.category == category]
+
+
+def test_add_assigns_ids_and_chapter():
+    state = make_state()
+    facts = state.facts["민수"]
+    assert [f.fact_id for f in facts] == ["f1", "f2", "f3"]
+    assert all(f.chapter_index == 1 for f in facts)
+
+
+def test_location_replaces_previous_value():
+    state = make_state()
+    state.apply_updates([{"entity": "민수", "category": "location", "value": "부산"}], chapter_index=2)
+    assert values(state, "민수", "location") == ["부산"]
+
+
+def test_relationship_replaced_per_target():
+    state = make_state()
+    state.apply_updates([
+        {"entity": "민수", "category": "relationship", "target": "지영", "value": "화해"},
+        {"entity": "민수", "category": "relationship", "target": "철수", "value": "친구"},
+    ], chapter_index=2)
+    assert values(state, "민수", "relationship") == ["화해", "친구"]
+
+
+def test_relationship_without_target_is_ignored():
+    state = StoryState()
+    state.apply_updates([{"entity": "민수", "category": "relationship", "value": "적대"}], chapter_index=1)
+    assert state.facts == {}
+
+
+def test_resolve_by_id():
+    state = make_state()
+    state.apply_updates([{"id": "f2", "resolved": True}], chapter_index=2)
+    assert values(state, "민수", "injury") == []
+    assert values(state, "민수", "location") == ["서울"]
+
+
+def test_resolved_string_false_adds_fact():
+    state = make_state()
+    state.apply_updates([
+        {"entity": "민수", "category": "possession", "value": "검", "resolved": "false"},
+    ], chapter_index=2)
+    assert values(state, "민수", "possession") == ["검"]
+    assert values(state, "민수", "injury") == ["왼팔 골절"]
+
+
+def test_resolved_string_true_resolves():
+    state = make_state()
+    state.apply_updates([{"id": "f2", "resolved": "true"}], chapter_index=2)
+    assert values(state, "민수", "injury") == []
+
+
+def test_resolving_last_fact_removes_entity():
+    state = StoryState()
+    state.add_fact(StateFact(entity="검", category="location", value="동굴", chapter_index=1))
+    state.resolve_fact("f1")
+    assert state.entities == []
+
+
+def test_invalid_updates_are_ignored():
+    state = StoryState()
+    state.apply_updates([
+        "not a dict",
+        {"entity": "", "category": "location", "value": "서울"},
+        {"entity": "민수", "category": "mood", "value": "기쁨"},
+        {"entity": "민수", "category": "location", "value": ""},
+    ], chapter_index=1)
+    assert state.facts == {}
+
+
+def test_round_trip_preserves_facts_and_ids():
+    state = make_state()
+    state.resolve_fact("f1")
+    loaded = StoryState.from_dict(state.to_dict())
+    assert loaded == state
+    loaded.add_fact(StateFact(entity="지영", category="location", value="부산", chapter_index=2))
+    assert loaded.facts["지영"][0].fact_id == "f4"
+
+
+def test_from_dict_skips_unknown_category():
+    data = {"facts": [
+        {"id": "f1", "entity": "민수", "category": "mood", "value": "기쁨", "chapter_index": 1},
+        {"id": "f2", "entity": "민수", "category": "location", "value": "서울", "chapter_index": 1},
+    ]}
+    state = StoryState.from_dict(data)
+    assert [f.category for f in state.facts["민수"]] == ["location"]
+
+
+def test_find_entities_and_facts_for():
+    state = make_state()
+    state.apply_updates([{"entity": "지영", "category": "location", "value": "부산"}], chapter_index=2)
+    assert state.find_entities(["민수가 문을 열었다.", None]) == ["민수"]
+    found = state.facts_for(["민수", "없는 이름"])
+    assert list(found) == ["민수"]
+    assert [f.fact_id for f in found["민수"]] == ["f1", "f2", "f3"]
+
+
+def test_find_entities_skips_short_names():
+    state = make_state()
+    state.apply_updates([{"entity": "검", "category": "location", "value": "동굴"}], chapter_index=2)
+    assert state.find_entities(["민수는 검은 옷을 입었다."]) == ["민수"]
+
+
+def test_cap_keeps_old_location_and_relationships():
+    state = make_state()
+    state.apply_updates([
+        {"entity": "민수", "category": "possession", "value": f"물건{i}"} for i in range(10)
+    ], chapter_index=2)
+    facts = state.facts_for(["민수"], max_per_category=3)["민수"]
+    assert [(f.category, f.value) for f in facts] == [
+        ("location", "서울"),
+        ("injury", "왼팔 골절"),
+        ("relationship", "적대"),
+        ("possession", "물건7"),
+        ("possession", "물건8"),
+        ("possession", "물건9"),
+    ]
+
+
+def test_parse_state_updates_plain_json():
+    assert parse_state_updates('[{"id": "f1", "resolved": true}]') == [{"id": "f1", "resolved": True}]
+
+
+def test_parse_state_updates_code_fence():
+    response = '```json\n[{"entity": "민수", "category": "location", "value": "서울"}]\n```\n'
+    assert parse_state_updates(response) == [{"entity": "민수", "category": "location", "value": "서울"}]
+
+
+def test_parse_state_updates_empty_list():
+    assert parse_state_updates("[]") == []
+
+
+def test_parse_state_updates_invalid():
+    assert parse_state_updates("변화 없음") is None
+    assert parse_state_updates('{"entity": "민수"}') is None
@@ -0,0 +1,49 @@
+from models.story_state import StoryState
+from prompts.story_state_formatter import format_story_state_section, trim_to_tail
+
+
+def test_trim_short_text_unchanged():
+    assert trim_to_tail("짧은 글이다.\n", 100) == "짧은 글이다."
+
+
+def test_trim_starts_at_paragraph_boundary():
+    text = "가" * 300 + "\n\n" + "나" * 80
+    assert trim_to_tail(text, 100) == "나" * 80
+
+
+def test_trim_starts_at_sentence_boundary():
+    text = "가" * 300 + "다. " + "나" * 80
+    assert trim_to_tail(text, 100) == "나" * 80
+
+
+def test_trim_trailing_newline_keeps_tail():
+    for ending in ("\n", "\n\n"):
+        result = trim_to_tail("가" * 2000 + "다." + ending, 1500)
+        assert len(result) == 1500
+        assert result.endswith("다.")
+
+
+def test_trim_ignores_boundary_leaving_too_little():
+    text = "가" * 300 + "\n\n" + "나" * 20
+    assert trim_to_tail(text, 100) == text[-100:]
+
+
+def test_section_only_includes_mentioned_entities():
+    state = StoryState()
+    state.apply_updates([
+        {"entity": "민수", "category": "location", "value": "서울"},
+        {"entity": "민수", "category": "relationship", "target": "지영", "value": "적대"},
+        {"entity": "철수", "category": "injury", "value": "발목 부상"},
+    ], chapter_index=3)
+    section = format_story_state_section(state, ["민수가 문을 열었다.", ""], max_per_category=5)
+    assert "**[등장 요소의 현재 상태]**" in section
+    assert "- 민수" in section
+    assert "위치: 서울 (3장)" in section
+    assert "관계: (지영) 적대 (3장)" in section
+    assert "철수" not in section
+
+
+def test_section_empty_without_matches():
+    state = StoryState()
+    state.apply_updates([{"entity": "민수", "category": "location", "value": "서울"}], chapter_index=1)
+    assert format_story_state_section(state, ["아무도 없다."], max_per_category=5) == ""